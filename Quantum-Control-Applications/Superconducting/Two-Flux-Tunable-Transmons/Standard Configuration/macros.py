@@ -125,28 +125,35 @@ def active_reset(threshold: float, qubit: str, resonator: str, max_tries=1, Ig=N
         Ig = declare(fixed)
     if (max_tries < 1) or (not float(max_tries).is_integer()):
         raise Exception("max_count must be an integer >= 1.")
-    # Initialize Ig to be > threshold
-    assign(Ig, threshold + 2**-28)
     # Number of tries for active reset
     counter = declare(int)
-    # Reset the number of tries
-    assign(counter, 0)
 
     # Perform active feedback
     align(qubit, resonator)
+    # Measure the resonator once before entering the feedback loop
+    measure(
+        "readout",
+        resonator,
+        None,
+        dual_demod.full("rotated_cos", "out1", "rotated_sin", "out2", Ig),
+    )
+    assign(counter, 1)
     # Use a while loop and counter for other protocols and tests
     with while_((Ig > threshold) & (counter < max_tries)):
+        # Play a pi pulse to get back to the ground state (the loop is only entered when Ig > threshold)
+        play("x180", qubit)
         # Measure the resonator
+        align(qubit, resonator)
         measure(
             "readout",
             resonator,
             None,
             dual_demod.full("rotated_cos", "out1", "rotated_sin", "out2", Ig),
         )
-        # Play a pi pulse to get back to the ground state
-        play("x180", qubit, condition=(Ig > threshold))
         # Increment the number of tries
         assign(counter, counter + 1)
+    # Play a last pi pulse if the qubit was still excited after the last try
+    play("x180", qubit, condition=(Ig > threshold))
     return Ig, counter
 
 
@@ -1,5 +1,7 @@
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
+from scipy.signal.windows import gaussian
 from qualang_tools.config.waveform_tools import drag_gaussian_pulse_waveforms
 from qualang_tools.units import unit
 from qualang_tools.config.waveform_tools import flattop_gaussian_waveform
@@ -10,6 +12,7 @@ from qualang_tools.config.waveform_tools import flattop_gaussian_waveform
 
 
 # IQ imbalance matrix
+@lru_cache(maxsize=None)
 def IQ_imbalance(g, phi):
     """
     Creates the correction matrix for the mixer imbalance caused by the gain and phase imbalances, more information can
@@ -17,11 +20,12 @@ def IQ_imbalance(g, phi):
     https://docs.qualang.io/libs/examples/mixer-calibration/#non-ideal-mixer
     :param g: relative gain imbalance between the 'I' & 'Q' ports. (unit-less), set to 0 for no gain imbalance.
     :param phi: relative phase imbalance between the 'I' & 'Q' ports (radians), set to 0 for no phase imbalance.
+    :return: the correction matrix as an immutable tuple, since results are cached and shared between mixers.
     """
-    c = np.cos(phi)
-    s = np.sin(phi)
+    c = float(np.cos(phi))
+    s = float(np.sin(phi))
     N = 1 / ((1 - g**2) * (2 * c**2 - 1))
-    return [float(N * x) for x in [(1 - g) * c, (1 + g) * s, (1 - g) * s, (1 + g) * c]]
+    return (N * (1 - g) * c, N * (1 + g) * s, N * (1 - g) * s, N * (1 + g) * c)
 
 
 #############
@@ -69,85 +73,114 @@ anharmonicity_q2 = -180 * u.MHz
 AC_stark_detuning_q1 = 0 * u.MHz
 AC_stark_detuning_q2 = 0 * u.MHz
 
-x180_wf_q1, x180_der_wf_q1 = np.array(
-    drag_gaussian_pulse_waveforms(pi_amp_q1, pi_len, pi_sigma, drag_coef_q1, anharmonicity_q1, AC_stark_detuning_q1)
-)
+# The DRAG waveforms are linear in the pulse amplitude, so they are computed once per qubit for a unit amplitude and
+# rescaled for each rotation.
+# No DRAG when alpha=0, it's just a gaussian: it is subtracted like in drag_gaussian_pulse_waveforms and the derivative
+# is zero, so the full DRAG computation is skipped. Both qubits share the same pulse length and width, so the unit
+# gaussian is only computed once.
+unit_gaussian = gaussian(pi_len, pi_sigma)
+unit_gaussian -= unit_gaussian[-1]
+if drag_coef_q1 == 0 and AC_stark_detuning_q1 == 0:
+    unit_wf_q1 = unit_gaussian
+    unit_der_wf_q1 = np.zeros_like(unit_wf_q1)
+else:
+    unit_wf_q1, unit_der_wf_q1 = np.array(
+        drag_gaussian_pulse_waveforms(1.0, pi_len, pi_sigma, drag_coef_q1, anharmonicity_q1, AC_stark_detuning_q1)
+    )
+if drag_coef_q2 == 0 and AC_stark_detuning_q2 == 0:
+    unit_wf_q2 = unit_gaussian
+    unit_der_wf_q2 = np.zeros_like(unit_wf_q2)
+else:
+    unit_wf_q2, unit_der_wf_q2 = np.array(
+        drag_gaussian_pulse_waveforms(1.0, pi_len, pi_sigma, drag_coef_q2, anharmonicity_q2, AC_stark_detuning_q2)
+    )
+# Single precision is well beyond the DAC resolution and halves the size of the waveform arrays
+unit_wf_q1, unit_der_wf_q1 = unit_wf_q1.astype(np.float32), unit_der_wf_q1.astype(np.float32)
+unit_wf_q2, unit_der_wf_q2 = unit_wf_q2.astype(np.float32), unit_der_wf_q2.astype(np.float32)
+
+# The gate waveforms of each qubit are the rows of a single contiguous array: rows 0-2 are the gaussians of the x180,
+# x90 and -x90 gates, rows 3-5 their DRAG derivatives and rows 6-8 the opposite of the derivatives, used by the y gates.
+_gate_amps_q1 = np.array([pi_amp_q1, pi_amp_q1 / 2, -pi_amp_q1 / 2], dtype=np.float32)
+_sq_waves_q1 = np.empty((9, pi_len), dtype=np.float32)
+np.multiply.outer(_gate_amps_q1, unit_wf_q1, out=_sq_waves_q1[0:3])
+np.multiply.outer(_gate_amps_q1, unit_der_wf_q1, out=_sq_waves_q1[3:6])
+np.negative(_sq_waves_q1[3:6], out=_sq_waves_q1[6:9])
+x180_wf_q1, x90_wf_q1, minus_x90_wf_q1 = _sq_waves_q1[0:3]
+x180_der_wf_q1, x90_der_wf_q1, minus_x90_der_wf_q1 = _sq_waves_q1[3:6]
+_gate_amps_q2 = np.array([pi_amp_q2, pi_amp_q2 / 2, -pi_amp_q2 / 2], dtype=np.float32)
+_sq_waves_q2 = np.empty((9, pi_len), dtype=np.float32)
+np.multiply.outer(_gate_amps_q2, unit_wf_q2, out=_sq_waves_q2[0:3])
+np.multiply.outer(_gate_amps_q2, unit_der_wf_q2, out=_sq_waves_q2[3:6])
+np.negative(_sq_waves_q2[3:6], out=_sq_waves_q2[6:9])
+x180_wf_q2, x90_wf_q2, minus_x90_wf_q2 = _sq_waves_q2[0:3]
+x180_der_wf_q2, x90_der_wf_q2, minus_x90_der_wf_q2 = _sq_waves_q2[3:6]
+
 x180_I_wf_q1 = x180_wf_q1
 x180_Q_wf_q1 = x180_der_wf_q1
-x180_wf_q2, x180_der_wf_q2 = np.array(
-    drag_gaussian_pulse_waveforms(pi_amp_q2, pi_len, pi_sigma, drag_coef_q2, anharmonicity_q2, AC_stark_detuning_q2)
-)
 x180_I_wf_q2 = x180_wf_q2
 x180_Q_wf_q2 = x180_der_wf_q2
-# No DRAG when alpha=0, it's just a gaussian.
 
-x90_wf_q1, x90_der_wf_q1 = np.array(
-    drag_gaussian_pulse_waveforms(pi_amp_q1 / 2, pi_len, pi_sigma, drag_coef_q1, anharmonicity_q1, AC_stark_detuning_q1)
-)
 x90_I_wf_q1 = x90_wf_q1
 x90_Q_wf_q1 = x90_der_wf_q1
-x90_wf_q2, x90_der_wf_q2 = np.array(
-    drag_gaussian_pulse_waveforms(pi_amp_q2 / 2, pi_len, pi_sigma, drag_coef_q2, anharmonicity_q2, AC_stark_detuning_q2)
-)
 x90_I_wf_q2 = x90_wf_q2
 x90_Q_wf_q2 = x90_der_wf_q2
-# No DRAG when alpha=0, it's just a gaussian.
 
-minus_x90_wf_q1, minus_x90_der_wf_q1 = np.array(
-    drag_gaussian_pulse_waveforms(
-        -pi_amp_q1 / 2, pi_len, pi_sigma, drag_coef_q1, anharmonicity_q1, AC_stark_detuning_q1
-    )
-)
 minus_x90_I_wf_q1 = minus_x90_wf_q1
 minus_x90_Q_wf_q1 = minus_x90_der_wf_q1
-minus_x90_wf_q2, minus_x90_der_wf_q2 = np.array(
-    drag_gaussian_pulse_waveforms(
-        -pi_amp_q2 / 2, pi_len, pi_sigma, drag_coef_q2, anharmonicity_q2, AC_stark_detuning_q2
-    )
-)
 minus_x90_I_wf_q2 = minus_x90_wf_q2
 minus_x90_Q_wf_q2 = minus_x90_der_wf_q2
-# No DRAG when alpha=0, it's just a gaussian.
 
-y180_wf_q1, y180_der_wf_q1 = np.array(
-    drag_gaussian_pulse_waveforms(pi_amp_q1, pi_len, pi_sigma, drag_coef_q1, anharmonicity_q1, AC_stark_detuning_q1)
-)
-y180_I_wf_q1 = (-1) * y180_der_wf_q1
+y180_wf_q1, y180_der_wf_q1 = x180_wf_q1, x180_der_wf_q1
+y180_I_wf_q1 = _sq_waves_q1[6]
 y180_Q_wf_q1 = y180_wf_q1
-y180_wf_q2, y180_der_wf_q2 = np.array(
-    drag_gaussian_pulse_waveforms(pi_amp_q2, pi_len, pi_sigma, drag_coef_q2, anharmonicity_q2, AC_stark_detuning_q2)
-)
-y180_I_wf_q2 = (-1) * y180_der_wf_q2
+y180_wf_q2, y180_der_wf_q2 = x180_wf_q2, x180_der_wf_q2
+y180_I_wf_q2 = _sq_waves_q2[6]
 y180_Q_wf_q2 = y180_wf_q2
-# No DRAG when alpha=0, it's just a gaussian.
 
-y90_wf_q1, y90_der_wf_q1 = np.array(
-    drag_gaussian_pulse_waveforms(pi_amp_q1 / 2, pi_len, pi_sigma, drag_coef_q1, anharmonicity_q1, AC_stark_detuning_q1)
-)
-y90_I_wf_q1 = (-1) * y90_der_wf_q1
+y90_wf_q1, y90_der_wf_q1 = x90_wf_q1, x90_der_wf_q1
+y90_I_wf_q1 = _sq_waves_q1[7]
 y90_Q_wf_q1 = y90_wf_q1
-y90_wf_q2, y90_der_wf_q2 = np.array(
-    drag_gaussian_pulse_waveforms(pi_amp_q2 / 2, pi_len, pi_sigma, drag_coef_q2, anharmonicity_q2, AC_stark_detuning_q2)
-)
-y90_I_wf_q2 = (-1) * y90_der_wf_q2
+y90_wf_q2, y90_der_wf_q2 = x90_wf_q2, x90_der_wf_q2
+y90_I_wf_q2 = _sq_waves_q2[7]
 y90_Q_wf_q2 = y90_wf_q2
-# No DRAG when alpha=0, it's just a gaussian.
 
-minus_y90_wf_q1, minus_y90_der_wf_q1 = np.array(
-    drag_gaussian_pulse_waveforms(
-        -pi_amp_q1 / 2, pi_len, pi_sigma, drag_coef_q1, anharmonicity_q1, AC_stark_detuning_q1
-    )
-)
-minus_y90_I_wf_q1 = (-1) * minus_y90_der_wf_q1
+minus_y90_wf_q1, minus_y90_der_wf_q1 = minus_x90_wf_q1, minus_x90_der_wf_q1
+minus_y90_I_wf_q1 = _sq_waves_q1[8]
 minus_y90_Q_wf_q1 = minus_y90_wf_q1
-minus_y90_wf_q2, minus_y90_der_wf_q2 = np.array(
-    drag_gaussian_pulse_waveforms(
-        -pi_amp_q2 / 2, pi_len, pi_sigma, drag_coef_q2, anharmonicity_q2, AC_stark_detuning_q2
-    )
-)
-minus_y90_I_wf_q2 = (-1) * minus_y90_der_wf_q2
+minus_y90_wf_q2, minus_y90_der_wf_q2 = minus_x90_wf_q2, minus_x90_der_wf_q2
+minus_y90_I_wf_q2 = _sq_waves_q2[8]
 minus_y90_Q_wf_q2 = minus_y90_wf_q2
-# No DRAG when alpha=0, it's just a gaussian.
+
+# Arbitrary waveforms, converted to lists in a single place when building the config
+_arbitrary_waveforms = {
+    "x90_I_wf_q1": x90_I_wf_q1,
+    "x90_Q_wf_q1": x90_Q_wf_q1,
+    "x180_I_wf_q1": x180_I_wf_q1,
+    "x180_Q_wf_q1": x180_Q_wf_q1,
+    "minus_x90_I_wf_q1": minus_x90_I_wf_q1,
+    "minus_x90_Q_wf_q1": minus_x90_Q_wf_q1,
+    "y90_I_wf_q1": y90_I_wf_q1,
+    "y90_Q_wf_q1": y90_Q_wf_q1,
+    "y180_I_wf_q1": y180_I_wf_q1,
+    "y180_Q_wf_q1": y180_Q_wf_q1,
+    "minus_y90_I_wf_q1": minus_y90_I_wf_q1,
+    "minus_y90_Q_wf_q1": minus_y90_Q_wf_q1,
+    "x90_I_wf_q2": x90_I_wf_q2,
+    "x90_Q_wf_q2": x90_Q_wf_q2,
+    "x180_I_wf_q2": x180_I_wf_q2,
+    "x180_Q_wf_q2": x180_Q_wf_q2,
+    "minus_x90_I_wf_q2": minus_x90_I_wf_q2,
+    "minus_x90_Q_wf_q2": minus_x90_Q_wf_q2,
+    "y90_I_wf_q2": y90_I_wf_q2,
+    "y90_Q_wf_q2": y90_Q_wf_q2,
+    "y180_I_wf_q2": y180_I_wf_q2,
+    "y180_Q_wf_q2": y180_Q_wf_q2,
+    "minus_y90_I_wf_q2": minus_y90_I_wf_q2,
+    "minus_y90_Q_wf_q2": minus_y90_Q_wf_q2,
+}
+
+# Single-qubit gates implemented on each qubit, "-" is written "minus_" in the waveform names
+_single_qubit_pulse_names = ["x90", "x180", "-x90", "y90", "y180", "-y90"]
 
 # Flux line
 const_flux_len = 200
@@ -177,6 +210,56 @@ rotation_angle_q2 = (0.0 / 180) * np.pi
 ge_threshold_q1 = 0.0
 ge_threshold_q2 = 0.0
 
+# The two resonators share the same readout line, only their intermediate frequency and readout pulse differ
+_rr_common = {
+    "mixInputs": {
+        "I": ("con1", 5),
+        "Q": ("con1", 6),
+        "lo_frequency": resonator_LO,
+        "mixer": "mixer_resonator",
+    },
+    "outputs": {
+        "out1": ("con1", 1),
+        "out2": ("con1", 2),
+    },
+    "time_of_flight": time_of_flight,
+    "smearing": 0,
+}
+
+# Integration weights: the rotated weights only depend on the cosine and sine of each qubit's rotation angle
+# The weights are immutable tuples of (value, length) segments, so the constant ones can be shared between entries
+_ones_weight = ((1.0, readout_len),)
+_zeros_weight = ((0.0, readout_len),)
+_minus_ones_weight = ((-1.0, readout_len),)
+integration_weights = {
+    "cosine_weights": {
+        "cosine": _ones_weight,
+        "sine": _zeros_weight,
+    },
+    "sine_weights": {
+        "cosine": _zeros_weight,
+        "sine": _ones_weight,
+    },
+    "minus_sine_weights": {
+        "cosine": _zeros_weight,
+        "sine": _minus_ones_weight,
+    },
+}
+for qb, rotation_angle in [("q1", rotation_angle_q1), ("q2", rotation_angle_q2)]:
+    c, s = float(np.cos(rotation_angle)), float(np.sin(rotation_angle))
+    integration_weights[f"rotated_cosine_weights_{qb}"] = {
+        "cosine": ((c, readout_len),),
+        "sine": ((s, readout_len),),
+    }
+    integration_weights[f"rotated_sine_weights_{qb}"] = {
+        "cosine": ((-s, readout_len),),
+        "sine": ((c, readout_len),),
+    }
+    integration_weights[f"rotated_minus_sine_weights_{qb}"] = {
+        "cosine": ((s, readout_len),),
+        "sine": ((-c, readout_len),),
+    }
+
 #############################################
 #                  Config                   #
 #############################################
@@ -205,42 +288,20 @@ config = {
     },
     "elements": {
         "rr1": {
-            "mixInputs": {
-                "I": ("con1", 5),
-                "Q": ("con1", 6),
-                "lo_frequency": resonator_LO,
-                "mixer": "mixer_resonator",
-            },
+            **_rr_common,
             "intermediate_frequency": resonator_IF_q1,  # frequency at offset ch7
             "operations": {
                 "cw": "const_pulse",
                 "readout": "readout_pulse_q1",
             },
-            "outputs": {
-                "out1": ("con1", 1),
-                "out2": ("con1", 2),
-            },
-            "time_of_flight": time_of_flight,
-            "smearing": 0,
         },
         "rr2": {
-            "mixInputs": {
-                "I": ("con1", 5),
-                "Q": ("con1", 6),
-                "lo_frequency": resonator_LO,
-                "mixer": "mixer_resonator",
-            },
+            **_rr_common,
             "intermediate_frequency": resonator_IF_q2,  # frequency at offset ch8
             "operations": {
                 "cw": "const_pulse",
                 "readout": "readout_pulse_q2",
             },
-            "outputs": {
-                "out1": ("con1", 1),
-                "out2": ("con1", 2),
-            },
-            "time_of_flight": time_of_flight,
-            "smearing": 0,
         },
         "q1_xy": {
             "mixInputs": {
@@ -319,53 +380,16 @@ config = {
                 "Q": "zero_wf",
             },
         },
-        "x90_pulse_q1": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "x90_I_wf_q1",
-                "Q": "x90_Q_wf_q1",
-            },
-        },
-        "x180_pulse_q1": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "x180_I_wf_q1",
-                "Q": "x180_Q_wf_q1",
-            },
-        },
-        "-x90_pulse_q1": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "minus_x90_I_wf_q1",
-                "Q": "minus_x90_Q_wf_q1",
-            },
-        },
-        "y90_pulse_q1": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "y90_I_wf_q1",
-                "Q": "y90_Q_wf_q1",
-            },
-        },
-        "y180_pulse_q1": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "y180_I_wf_q1",
-                "Q": "y180_Q_wf_q1",
-            },
-        },
-        "-y90_pulse_q1": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "minus_y90_I_wf_q1",
-                "Q": "minus_y90_Q_wf_q1",
-            },
+        **{
+            f"{g}_pulse_q1": {
+                "operation": "control",
+                "length": pi_len,
+                "waveforms": {
+                    "I": f"{g.replace('-', 'minus_')}_I_wf_q1",
+                    "Q": f"{g.replace('-', 'minus_')}_Q_wf_q1",
+                },
+            }
+            for g in _single_qubit_pulse_names
         },
         "readout_pulse_q1": {
             "operation": "measurement",
@@ -384,53 +408,16 @@ config = {
             },
             "digital_marker": "ON",
         },
-        "x90_pulse_q2": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "x90_I_wf_q2",
-                "Q": "x90_Q_wf_q2",
-            },
-        },
-        "x180_pulse_q2": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "x180_I_wf_q2",
-                "Q": "x180_Q_wf_q2",
-            },
-        },
-        "-x90_pulse_q2": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "minus_x90_I_wf_q2",
-                "Q": "minus_x90_Q_wf_q2",
-            },
-        },
-        "y90_pulse_q2": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "y90_I_wf_q2",
-                "Q": "y90_Q_wf_q2",
-            },
-        },
-        "y180_pulse_q2": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "y180_I_wf_q2",
-                "Q": "y180_Q_wf_q2",
-            },
-        },
-        "-y90_pulse_q2": {
-            "operation": "control",
-            "length": pi_len,
-            "waveforms": {
-                "I": "minus_y90_I_wf_q2",
-                "Q": "minus_y90_Q_wf_q2",
-            },
+        **{
+            f"{g}_pulse_q2": {
+                "operation": "control",
+                "length": pi_len,
+                "waveforms": {
+                    "I": f"{g.replace('-', 'minus_')}_I_wf_q2",
+                    "Q": f"{g.replace('-', 'minus_')}_Q_wf_q2",
+                },
+            }
+            for g in _single_qubit_pulse_names
         },
         "readout_pulse_q2": {
             "operation": "measurement",
@@ -455,74 +442,14 @@ config = {
         "cz_wf": {"type": "constant", "sample": cz_amp},
         "const_flux_wf": {"type": "constant", "sample": const_flux_amp},
         "zero_wf": {"type": "constant", "sample": 0.0},
-        "x90_I_wf_q1": {"type": "arbitrary", "samples": x90_I_wf_q1.tolist()},
-        "x90_Q_wf_q1": {"type": "arbitrary", "samples": x90_Q_wf_q1.tolist()},
-        "x180_I_wf_q1": {"type": "arbitrary", "samples": x180_I_wf_q1.tolist()},
-        "x180_Q_wf_q1": {"type": "arbitrary", "samples": x180_Q_wf_q1.tolist()},
-        "minus_x90_I_wf_q1": {"type": "arbitrary", "samples": minus_x90_I_wf_q1.tolist()},
-        "minus_x90_Q_wf_q1": {"type": "arbitrary", "samples": minus_x90_Q_wf_q1.tolist()},
-        "y90_I_wf_q1": {"type": "arbitrary", "samples": y90_I_wf_q1.tolist()},
-        "y90_Q_wf_q1": {"type": "arbitrary", "samples": y90_Q_wf_q1.tolist()},
-        "y180_I_wf_q1": {"type": "arbitrary", "samples": y180_I_wf_q1.tolist()},
-        "y180_Q_wf_q1": {"type": "arbitrary", "samples": y180_Q_wf_q1.tolist()},
-        "minus_y90_I_wf_q1": {"type": "arbitrary", "samples": minus_y90_I_wf_q1.tolist()},
-        "minus_y90_Q_wf_q1": {"type": "arbitrary", "samples": minus_y90_Q_wf_q1.tolist()},
         "readout_wf_q1": {"type": "constant", "sample": readout_amp_q1},
-        "x90_I_wf_q2": {"type": "arbitrary", "samples": x90_I_wf_q2.tolist()},
-        "x90_Q_wf_q2": {"type": "arbitrary", "samples": x90_Q_wf_q2.tolist()},
-        "x180_I_wf_q2": {"type": "arbitrary", "samples": x180_I_wf_q2.tolist()},
-        "x180_Q_wf_q2": {"type": "arbitrary", "samples": x180_Q_wf_q2.tolist()},
-        "minus_x90_I_wf_q2": {"type": "arbitrary", "samples": minus_x90_I_wf_q2.tolist()},
-        "minus_x90_Q_wf_q2": {"type": "arbitrary", "samples": minus_x90_Q_wf_q2.tolist()},
-        "y90_I_wf_q2": {"type": "arbitrary", "samples": y90_I_wf_q2.tolist()},
-        "y90_Q_wf_q2": {"type": "arbitrary", "samples": y90_Q_wf_q2.tolist()},
-        "y180_I_wf_q2": {"type": "arbitrary", "samples": y180_I_wf_q2.tolist()},
-        "y180_Q_wf_q2": {"type": "arbitrary", "samples": y180_Q_wf_q2.tolist()},
-        "minus_y90_I_wf_q2": {"type": "arbitrary", "samples": minus_y90_I_wf_q2.tolist()},
-        "minus_y90_Q_wf_q2": {"type": "arbitrary", "samples": minus_y90_Q_wf_q2.tolist()},
         "readout_wf_q2": {"type": "constant", "sample": readout_amp_q2},
+        **{name: {"type": "arbitrary", "samples": wf.tolist()} for name, wf in _arbitrary_waveforms.items()},
     },
     "digital_waveforms": {
         "ON": {"samples": [(1, 0)]},
     },
-    "integration_weights": {
-        "cosine_weights": {
-            "cosine": [(1.0, readout_len)],
-            "sine": [(0.0, readout_len)],
-        },
-        "sine_weights": {
-            "cosine": [(0.0, readout_len)],
-            "sine": [(1.0, readout_len)],
-        },
-        "minus_sine_weights": {
-            "cosine": [(0.0, readout_len)],
-            "sine": [(-1.0, readout_len)],
-        },
-        "rotated_cosine_weights_q1": {
-            "cosine": [(np.cos(rotation_angle_q1), readout_len)],
-            "sine": [(np.sin(rotation_angle_q1), readout_len)],
-        },
-        "rotated_sine_weights_q1": {
-            "cosine": [(-np.sin(rotation_angle_q1), readout_len)],
-            "sine": [(np.cos(rotation_angle_q1), readout_len)],
-        },
-        "rotated_minus_sine_weights_q1": {
-            "cosine": [(np.sin(rotation_angle_q1), readout_len)],
-            "sine": [(-np.cos(rotation_angle_q1), readout_len)],
-        },
-        "rotated_cosine_weights_q2": {
-            "cosine": [(np.cos(rotation_angle_q2), readout_len)],
-            "sine": [(np.sin(rotation_angle_q2), readout_len)],
-        },
-        "rotated_sine_weights_q2": {
-            "cosine": [(-np.sin(rotation_angle_q2), readout_len)],
-            "sine": [(np.cos(rotation_angle_q2), readout_len)],
-        },
-        "rotated_minus_sine_weights_q2": {
-            "cosine": [(np.sin(rotation_angle_q2), readout_len)],
-            "sine": [(-np.cos(rotation_angle_q2), readout_len)],
-        },
-    },
+    "integration_weights": integration_weights,
     "mixers": {
         "mixer_qubit_q1": [
             {
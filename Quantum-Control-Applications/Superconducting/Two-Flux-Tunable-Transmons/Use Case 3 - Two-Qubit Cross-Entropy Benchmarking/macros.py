@@ -5,27 +5,36 @@ Author: Arthur Strauss - Quantum Machines
 Last updated: 2024-04-30
 """
 
-import pandas as pd
-from matplotlib import pyplot as plt, colors
 from qm.qua import *
 from qualang_tools.addons.variables import assign_variables_to_element
 import numpy as np
 from scipy.optimize import optimize
-from scipy.stats import stats
+from scipy.stats import linregress
 
 
-def assign_amplitude_matrix(gate, amp_matrix, gate_dict: dict):
+def declare_amplitude_table(gate_dict: dict):
+    """
+    QUA Macro for declaring a lookup table containing the amplitude matrices of all gates.
+    The four amplitude matrix arguments of gate i are stored at indices 4*i to 4*i+3.
+    :param gate_dict: Dictionary of gates
+    :return: QUA fixed array of size 4 * len(gate_dict)
+    """
+    return declare(fixed, value=[float(v) for i in range(len(gate_dict)) for v in gate_dict[i]["amp_matrix"]])
+
+
+def assign_amplitude_matrix(gate, amp_matrix, amp_table):
     """
     QUA Macro for assigning the amplitude matrix arguments for a given gate index.
     :param gate: Gate index
     :param amp_matrix: Amplitude matrix arguments
-    :param gate_dict: Dictionary of gates
+    :param amp_table: Amplitude matrices lookup table (see declare_amplitude_table)
     """
-    with switch_(gate):
-        for i in range(len(gate_dict)):
-            with case_(i):
-                for j in range(4):
-                    assign(amp_matrix[j], gate_dict[i]["amp_matrix"][j])
+    # The offset of the gate in the table is computed once and shared by the four assignments
+    offset = declare(int)
+    assign(offset, 4 * gate)
+    assign(amp_matrix[0], amp_table[offset])
+    for j in range(1, 4):
+        assign(amp_matrix[j], amp_table[offset + j])
 
 
 def qua_declaration(n_qubits: int, readout_elements: list):
@@ -76,21 +85,40 @@ def play_SW_gate_set(gate, amp_matrix, qubit_el):
             play("sx" * amp(*amp_matrix), qubit_el)
 
 
-def play_random_sq_gate(gate, amp_matrix, qubit_el, gate_dict: dict):
+def play_amp_matrix_gate_set(gate, amp_matrix, qubit_el):
     """
-    QUA Macro for playing a random single-qubit gate
-    :param gate: Gate index
+    QUA Macro for gate sets in which all gates are played from the baseline SX pulse modulated by the amplitude matrix
+    :param gate: Gate index (unused, the gate is fully determined by the amplitude matrix)
     :param amp_matrix: Amplitude matrix
     :param qubit_el: Qubit element
-    :param gate_dict: Dictionary of gates
     """
+    play("sx" * amp(*amp_matrix), qubit_el)
+
 
+def make_sq_gate_player(gate_dict: dict):
+    """
+    Select the QUA Macro playing random single-qubit gates for the given gate set.
+    The gate set is fixed when building the program, so the selection is done once instead of at every gate.
+    :param gate_dict: Dictionary of gates
+    :return: QUA Macro with signature (gate, amp_matrix, qubit_el)
+    """
     if gate_dict[2]["gate"].name == "t":  # T gate involves frame rotation
-        play_T_gate_set(gate, amp_matrix, qubit_el)
+        return play_T_gate_set
     elif gate_dict[2]["gate"].label == "sw":
-        play_SW_gate_set(gate, amp_matrix, qubit_el)
+        return play_SW_gate_set
     else:
-        play("sx" * amp(*amp_matrix), qubit_el)
+        return play_amp_matrix_gate_set
+
+
+def play_random_sq_gate(gate, amp_matrix, qubit_el, gate_dict: dict):
+    """
+    QUA Macro for playing a random single-qubit gate
+    :param gate: Gate index
+    :param amp_matrix: Amplitude matrix
+    :param qubit_el: Qubit element
+    :param gate_dict: Dictionary of gates
+    """
+    make_sq_gate_player(gate_dict)(gate, amp_matrix, qubit_el)
 
 
 def cz_gate(control, target, CZ_operations: dict):
@@ -111,7 +139,7 @@ def binary(n, length):
     :param length: Length of the output string
     :return: Binary string corresponding to integer n
     """
-    return bin(n)[2:].zfill(length)
+    return format(n, f"0{length}b")
 
 
 def cross_entropy(p, q, epsilon=1e-15):
@@ -126,18 +154,25 @@ def cross_entropy(p, q, epsilon=1e-15):
     Returns:
     - Cross entropy between p and q
     """
-    q = np.maximum(q, epsilon)  # Avoid taking the logarithm of zero
-    x_entropy = -np.sum(p * np.log(q))
+    q = np.asarray(q, dtype=float)
+    # Avoid taking the logarithm of zero: entries below epsilon are given log(epsilon), NaN entries still propagate
+    log_q = np.full_like(q, np.log(epsilon))
+    np.log(q, where=~(q <= epsilon), out=log_q)
+    x_entropy = -np.dot(p, log_q)
     return x_entropy
 
 
 def create_subplot(data, subplot_number, title, depths, seqs):
+    # matplotlib is only imported when plotting, so that importing the QUA macros stays lightweight
+    from matplotlib import pyplot as plt
+
     print(title)
     print("data: %s" % data)
     print(subplot_number)
     plt.subplot(subplot_number)
-    # plt.pcolor(depths, range(seqs), np.abs(data), vmin=0., vmax=1.)
-    plt.pcolor(depths, range(seqs), np.abs(data))
+    # data is expected to be real-valued (e.g. probabilities), take np.abs beforehand for complex data
+    # plt.pcolormesh(depths, range(seqs), data, shading="auto", vmin=0., vmax=1.)
+    plt.pcolormesh(depths, range(seqs), data, shading="auto")
     ax = plt.gca()
     ax.set_title(title)
     if subplot_number > 244:
@@ -149,6 +184,9 @@ def create_subplot(data, subplot_number, title, depths, seqs):
 
 
 def per_cycle_depth(df):
+    import pandas as pd
+    from matplotlib import pyplot as plt, colors
+
     fid_lsq = df["numerator"].sum() / df["denominator"].sum()
 
     cycle_depth = df.name
@@ -177,10 +215,29 @@ def exponential_decay(cycle_depths: np.ndarray, a: float, layer_fid: float) -> n
     return a * layer_fid**cycle_depths
 
 
+def exponential_decay_jacobian(cycle_depths: np.ndarray, a: float, layer_fid: float) -> np.ndarray:
+    """Analytical Jacobian of `exponential_decay` with respect to its parameters `a` and `layer_fid`.
+
+    Args:
+        cycle_depths: The various depths at which fidelity was estimated.
+        a: A scale parameter in the exponential function.
+        layer_fid: The base of the exponent in the exponential function.
+
+    Returns:
+        Array of shape (len(cycle_depths), 2) containing the derivatives with respect to `a` and `layer_fid`.
+    """
+    cycle_depths = np.asarray(cycle_depths)
+    d_a = layer_fid**cycle_depths
+    # x * layer_fid**(x-1), written so that x = 0 gives 0 even when layer_fid = 0
+    d_layer_fid = a * cycle_depths * layer_fid ** np.maximum(cycle_depths - 1, 0)
+    return np.column_stack((d_a, d_layer_fid))
+
+
 def fit_exponential_decay(cycle_depths: np.ndarray, fidelities: np.ndarray) -> tuple[float, float, float, float]:
     """Fit an exponential model fidelity = a * layer_fid**x using nonlinear least squares.
 
-    This uses `exponential_decay` as the function to fit with parameters `a` and `layer_fid`.
+    This uses `exponential_decay` as the function to fit with parameters `a` and `layer_fid`, and its analytical
+    Jacobian `exponential_decay_jacobian` to avoid finite-difference evaluations.
     This function is taken from the following Cirq code: https://github.com/quantumlib/Cirq/blob/main/cirq-core/cirq/experiments/xeb_fitting.py
 
     Args:
@@ -199,13 +256,12 @@ def fit_exponential_decay(cycle_depths: np.ndarray, fidelities: np.ndarray) -> t
     cycle_depths = np.asarray(cycle_depths)
     fidelities = np.asarray(fidelities)
     mask = (fidelities > 0) & (fidelities < 1)
-    print()
     masked_cycle_depths = cycle_depths[mask]
     masked_fidelities = fidelities[mask]
 
     log_fidelities = np.log(masked_fidelities)
 
-    slope, intercept, _, _, _ = stats.linregress(masked_cycle_depths, log_fidelities)
+    slope, intercept, _, _, _ = linregress(masked_cycle_depths, log_fidelities)
     layer_fid_0 = np.clip(np.exp(slope), 0, 1)
     a_0 = np.clip(np.exp(intercept), 0, 1)
 
@@ -215,6 +271,7 @@ def fit_exponential_decay(cycle_depths: np.ndarray, fidelities: np.ndarray) -> t
             masked_cycle_depths,
             masked_fidelities,
             p0=(a_0, layer_fid_0),
+            jac=exponential_decay_jacobian,
             bounds=((0, 0), (1, 1)),
             nan_policy="omit",
         )